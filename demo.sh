@@ -4,7 +4,7 @@ docker-compose up -d
 sleep 10
 
 # Install dependencies
-pip install fastapi uvicorn requests psycopg2-binary
+pip install -r requirements.txt
 
 # Start API in background
 python src/provisioning_api.py &
@@ -4,276 +4,460 @@ Self-Service Database Provisioning Platform
 REST API for on-demand database provisioning
 """
 
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import Optional, List
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+from typing import Literal, Optional, List
 from datetime import datetime
-import psycopg2
+from cachetools import TTLCache
+import asyncpg
+import orjson
+import os
+import queue
 import uuid
 import logging
+import logging.handlers
 
-logging.basicConfig(level=logging.INFO)
+# Route log records through a queue so stream I/O happens on a background
+# thread instead of the event loop
+_log_queue = queue.SimpleQueue()
+logging.basicConfig(level=logging.WARNING,
+                    handlers=[logging.handlers.QueueHandler(_log_queue)])
+_log_listener = logging.handlers.QueueListener(_log_queue,
+                                               logging.StreamHandler())
+_log_listener.start()
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Self-Service DB Provisioning API", version="1.0.0")
+app = FastAPI(
+    title="Self-Service DB Provisioning API",
+    version="1.0.0",
+    default_response_class=ORJSONResponse
+)
 
 
 class DatabaseRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     team_name: str
-    db_type: str  # postgres, mysql, redis
-    environment: str  # dev, staging, prod
-    size: str  # small, medium, large
+    db_type: Literal["postgres", "mysql", "redis"]
+    environment: Literal["dev", "staging", "prod"]
+    size: Literal["small", "medium", "large"]
     purpose: str
 
 
 class ApprovalAction(BaseModel):
-    request_id: str
-    action: str  # approve, reject
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    request_id: uuid.UUID
+    action: Literal["approve", "reject"]
     approver: str
     notes: Optional[str] = None
 
 
+class ApprovalBatch(BaseModel):
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
+    actions: List[ApprovalAction]
+
+
+# Hot-path SQL as module-level constants. asyncpg caches prepared
+# statements per connection keyed on the exact SQL text, so when the cache
+# is enabled (DB_STATEMENT_CACHE_SIZE > 0, direct-to-Postgres setups)
+# issuing the identical string from every call skips server-side
+# parse/plan after the first execution on each pooled connection. Under
+# the default PgBouncer transaction-pooling topology the cache must stay
+# at 0 and these are simply the shared query text.
+INSERT_REQUEST_SQL = """
+    INSERT INTO db_requests
+    (team_name, db_type, environment, size, purpose, status)
+    VALUES ($1, $2, $3, $4, $5, 'pending')
+    RETURNING request_id::text
+"""
+
+SELECT_STATUS_SQL = "SELECT status FROM db_requests WHERE request_id = $1"
+
+# Postgres writes a given row at most once per statement, so the updating
+# CTE sets the terminal 'provisioned' status directly; the insert and the
+# main query both read from it.
+APPROVE_SQL = """
+    WITH upd AS (
+        UPDATE db_requests
+        SET status = 'provisioned', approver = $2, approval_notes = $3,
+            approved_at = NOW(), provisioned_at = NOW()
+        WHERE request_id = $1 AND status = 'pending'
+        RETURNING request_id, team_name, db_type, environment, size
+    ),
+    ins AS (
+        INSERT INTO provisioned_databases
+        (request_id, db_name, db_type, environment, host, port,
+         estimated_cost, status)
+        SELECT request_id,
+               team_name || '_' || environment || '_' || db_type || '_' || $4,
+               db_type, environment, 'db-cluster.example.com',
+               CASE db_type
+                   WHEN 'postgres' THEN 5432
+                   WHEN 'mysql' THEN 3306
+                   WHEN 'redis' THEN 6379
+               END,
+               CASE size
+                   WHEN 'small' THEN 50.00
+                   WHEN 'medium' THEN 150.00
+                   WHEN 'large' THEN 500.00
+               END,
+               'active'
+        FROM upd
+        RETURNING request_id
+    )
+    SELECT request_id FROM upd
+"""
+
+REJECT_SQL = """
+    UPDATE db_requests
+    SET status = 'rejected', approver = $2, approval_notes = $3,
+        approved_at = NOW()
+    WHERE request_id = $1 AND status = 'pending'
+    RETURNING request_id
+"""
+
+SELECT_DATABASES_SQL = """
+    SELECT d.db_id, d.db_name, d.db_type, d.environment, d.host,
+           d.port, d.estimated_cost::float8 AS estimated_monthly_cost,
+           d.status, d.created_at, r.team_name
+    FROM provisioned_databases d
+    JOIN db_requests r ON d.request_id = r.request_id
+    WHERE d.status = 'active'
+    ORDER BY d.created_at DESC
+"""
+
+DATABASE_TOTALS_SQL = """
+    SELECT COUNT(*), COALESCE(SUM(estimated_cost), 0)::float8
+    FROM provisioned_databases
+    WHERE status = 'active'
+"""
+
+
 class ProvisioningService:
-    
+
     def __init__(self):
-        self.conn = None
-        self.connect()
-        self.setup_tables()
-    
-    def connect(self):
+        self.pool = None
+
+    async def connect(self):
         try:
-            self.conn = psycopg2.connect(
-                host='localhost',
-                port=5445,
-                dbname='provisioning_db',
+            self.pool = await asyncpg.create_pool(
+                host=os.environ.get('DB_HOST', 'localhost'),
+                port=int(os.environ.get('DB_PORT', 6432)),
+                database='provisioning_db',
                 user='postgres',
-                password='postgres'
+                password='postgres',
+                min_size=2,
+                max_size=10,
+                # 0 is required for the default PgBouncer transaction-pooling
+                # topology, which cannot track named prepared statements; set
+                # e.g. 100 when DB_HOST/DB_PORT point straight at Postgres to
+                # get the prepared-statement cache back
+                statement_cache_size=int(
+                    os.environ.get('DB_STATEMENT_CACHE_SIZE', 0))
             )
-            self.conn.autocommit = True
             logger.info("Connected to provisioning database")
         except Exception as e:
-            logger.error(f"Connection failed: {e}")
-    
-    def setup_tables(self):
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS db_requests (
-                request_id VARCHAR(36) PRIMARY KEY,
-                team_name VARCHAR(100),
-                db_type VARCHAR(20),
-                environment VARCHAR(20),
-                size VARCHAR(20),
-                purpose TEXT,
-                status VARCHAR(20) DEFAULT 'pending',
-                created_at TIMESTAMP DEFAULT NOW(),
-                approved_at TIMESTAMP,
-                provisioned_at TIMESTAMP,
-                approver VARCHAR(100),
-                approval_notes TEXT
-            );
-            
-            CREATE TABLE IF NOT EXISTS provisioned_databases (
-                db_id SERIAL PRIMARY KEY,
-                request_id VARCHAR(36) REFERENCES db_requests(request_id),
-                db_name VARCHAR(100),
-                db_type VARCHAR(20),
-                environment VARCHAR(20),
-                host VARCHAR(100),
-                port INT,
-                estimated_cost DECIMAL(10,2),
-                status VARCHAR(20) DEFAULT 'active',
-                created_at TIMESTAMP DEFAULT NOW()
-            );
-        """)
-        cursor.close()
+            logger.error("Connection failed: %s", e)
+
+    async def close(self):
+        if self.pool is not None:
+            await self.pool.close()
+            logger.info("Connection pool closed")
+
+    async def setup_tables(self):
+        async with self.pool.acquire() as conn:
+            await conn.execute("""
+                CREATE EXTENSION IF NOT EXISTS pgcrypto;
+
+                CREATE TABLE IF NOT EXISTS db_requests (
+                    request_id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+                    team_name VARCHAR(100),
+                    db_type VARCHAR(20),
+                    environment VARCHAR(20),
+                    size VARCHAR(20),
+                    purpose TEXT,
+                    status VARCHAR(20) DEFAULT 'pending',
+                    created_at TIMESTAMP DEFAULT NOW(),
+                    approved_at TIMESTAMP,
+                    provisioned_at TIMESTAMP,
+                    approver VARCHAR(100),
+                    approval_notes TEXT
+                );
+
+                CREATE TABLE IF NOT EXISTS provisioned_databases (
+                    db_id SERIAL PRIMARY KEY,
+                    request_id UUID REFERENCES db_requests(request_id),
+                    db_name VARCHAR(100),
+                    db_type VARCHAR(20),
+                    environment VARCHAR(20),
+                    host VARCHAR(100),
+                    port INT,
+                    estimated_cost DECIMAL(10,2),
+                    status VARCHAR(20) DEFAULT 'active',
+                    created_at TIMESTAMP DEFAULT NOW()
+                );
+
+                -- Databases created before request_id became UUID (e.g. a
+                -- kept postgres_data volume) still have VARCHAR(36)
+                -- columns, which every uuid-typed bind would reject.
+                -- Convert them in place; all stored values are uuid4 text.
+                DO $$
+                BEGIN
+                    IF EXISTS (SELECT 1 FROM information_schema.columns
+                               WHERE table_name = 'db_requests'
+                                 AND column_name = 'request_id'
+                                 AND data_type = 'character varying') THEN
+                        ALTER TABLE provisioned_databases
+                            DROP CONSTRAINT IF EXISTS
+                                provisioned_databases_request_id_fkey;
+                        ALTER TABLE db_requests
+                            ALTER COLUMN request_id TYPE uuid
+                                USING request_id::uuid,
+                            ALTER COLUMN request_id
+                                SET DEFAULT gen_random_uuid();
+                        ALTER TABLE provisioned_databases
+                            ALTER COLUMN request_id TYPE uuid
+                                USING request_id::uuid;
+                        ALTER TABLE provisioned_databases
+                            ADD CONSTRAINT provisioned_databases_request_id_fkey
+                                FOREIGN KEY (request_id)
+                                REFERENCES db_requests(request_id);
+                    END IF;
+                END $$;
+
+                CREATE INDEX IF NOT EXISTS idx_req_status_created
+                    ON db_requests(status, created_at DESC);
+                CREATE INDEX IF NOT EXISTS idx_prov_status_created
+                    ON provisioned_databases(status, created_at DESC);
+                CREATE INDEX IF NOT EXISTS idx_prov_request_id
+                    ON provisioned_databases(request_id);
+            """)
         logger.info("Tables initialized")
-    
-    def create_request(self, request: DatabaseRequest) -> dict:
-        request_id = str(uuid.uuid4())
-        
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO db_requests 
-            (request_id, team_name, db_type, environment, size, purpose, status)
-            VALUES (%s, %s, %s, %s, %s, %s, 'pending')
-        """, (request_id, request.team_name, request.db_type, 
-              request.environment, request.size, request.purpose))
-        cursor.close()
-        
-        logger.info(f"Created request {request_id}")
-        
+
+    async def create_request(self, request: DatabaseRequest) -> dict:
+        async with self.pool.acquire() as conn:
+            # The server mints the UUID (gen_random_uuid) and hands it back
+            request_id = await conn.fetchval(
+                INSERT_REQUEST_SQL,
+                request.team_name, request.db_type,
+                request.environment, request.size, request.purpose)
+
+        logger.info("Created request %s", request_id)
+
         return {
             'request_id': request_id,
             'status': 'pending',
             'message': 'Request submitted for approval'
         }
-    
-    def get_requests(self, status: Optional[str] = None) -> List[dict]:
-        cursor = self.conn.cursor()
-        
-        if status:
-            cursor.execute("""
-                SELECT request_id, team_name, db_type, environment, size, 
-                       status, created_at, purpose
-                FROM db_requests
-                WHERE status = %s
-                ORDER BY created_at DESC
-            """, (status,))
-        else:
-            cursor.execute("""
-                SELECT request_id, team_name, db_type, environment, size, 
-                       status, created_at, purpose
-                FROM db_requests
-                ORDER BY created_at DESC
-                LIMIT 50
-            """)
-        
-        requests = []
-        for row in cursor.fetchall():
-            requests.append({
-                'request_id': row[0],
-                'team_name': row[1],
-                'db_type': row[2],
-                'environment': row[3],
-                'size': row[4],
-                'status': row[5],
-                'created_at': row[6].isoformat() if row[6] else None,
-                'purpose': row[7]
-            })
-        
-        cursor.close()
-        return requests
-    
-    def process_approval(self, approval: ApprovalAction) -> dict:
-        cursor = self.conn.cursor()
-        
-        # Check if request exists
-        cursor.execute(
-            "SELECT status FROM db_requests WHERE request_id = %s",
-            (approval.request_id,)
-        )
-        result = cursor.fetchone()
-        
-        if not result:
-            cursor.close()
-            raise HTTPException(status_code=404, detail="Request not found")
-        
-        if result[0] != 'pending':
-            cursor.close()
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Request already {result[0]}"
-            )
-        
+
+    async def get_requests(self, status: Optional[str] = None) -> List[dict]:
+        async with self.pool.acquire() as conn:
+            if status:
+                rows = await conn.fetch("""
+                    SELECT request_id::text, team_name, db_type, environment,
+                           size, status, created_at, purpose
+                    FROM db_requests
+                    WHERE status = $1
+                    ORDER BY created_at DESC
+                """, status)
+            else:
+                rows = await conn.fetch("""
+                    SELECT request_id::text, team_name, db_type, environment,
+                           size, status, created_at, purpose
+                    FROM db_requests
+                    ORDER BY created_at DESC
+                    LIMIT 50
+                """)
+
+        # asyncpg Records already map column name -> value, so dict(row)
+        # replaces per-row dict construction in Python
+        return [dict(row) for row in rows]
+
+    async def process_approval(self, approval: ApprovalAction) -> dict:
         new_status = 'approved' if approval.action == 'approve' else 'rejected'
-        
-        cursor.execute("""
-            UPDATE db_requests
-            SET status = %s, approver = %s, approval_notes = %s, 
-                approved_at = NOW()
-            WHERE request_id = %s
-        """, (new_status, approval.approver, approval.notes, approval.request_id))
-        
-        # If approved, provision the database
-        if approval.action == 'approve':
-            self._provision_database(approval.request_id, cursor)
-        
-        cursor.close()
-        
-        logger.info(f"Request {approval.request_id} {new_status}")
-        
+
+        async with self.pool.acquire() as conn:
+            # Both statements only touch pending rows and yield the id of
+            # the row they actually updated (the upd CTE's RETURNING on the
+            # approve path), so the happy path is a single round-trip with
+            # no separate existence check.
+            if approval.action == 'approve':
+                # Approve, provision and mark provisioned in one statement
+                # so the hot path costs a single round-trip instead of 4-5.
+                updated = await conn.fetchval(
+                    APPROVE_SQL,
+                    approval.request_id, approval.approver, approval.notes,
+                    uuid.uuid4().hex[:8])
+            else:
+                updated = await conn.fetchval(
+                    REJECT_SQL,
+                    approval.request_id, approval.approver, approval.notes)
+
+            if updated is None:
+                # Miss path only: distinguish unknown id from
+                # already-processed with one follow-up query
+                current = await conn.fetchval(SELECT_STATUS_SQL,
+                                              approval.request_id)
+                if current is None:
+                    raise HTTPException(status_code=404,
+                                        detail="Request not found")
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Request already {current}"
+                )
+
+        logger.info("Request %s %s", approval.request_id, new_status)
+
         return {
             'request_id': approval.request_id,
             'status': new_status,
             'message': f'Request {new_status} successfully'
         }
-    
-    def _provision_database(self, request_id: str, cursor):
-        # Get request details
-        cursor.execute("""
-            SELECT team_name, db_type, environment, size
-            FROM db_requests
-            WHERE request_id = %s
-        """, (request_id,))
-        
-        team, db_type, env, size = cursor.fetchone()
-        
-        # Generate database details
-        db_name = f"{team}_{env}_{db_type}_{uuid.uuid4().hex[:8]}"
-        
-        # Size to cost mapping
-        cost_map = {
-            'small': 50.00,
-            'medium': 150.00,
-            'large': 500.00
+
+    async def process_approval_batch(self, batch: ApprovalBatch) -> dict:
+        approvals = [a for a in batch.actions if a.action == 'approve']
+        rejections = [a for a in batch.actions if a.action != 'approve']
+
+        approved = []
+        rejected = []
+        async with self.pool.acquire() as conn:
+            # Approve and provision the whole batch in one statement; unnest
+            # turns the parallel arrays into rows, and as in APPROVE_SQL the
+            # updating CTE writes the terminal status in its single write
+            # (Postgres skips a second same-statement update of a row).
+            if approvals:
+                rows = await conn.fetch("""
+                    WITH input AS (
+                        SELECT * FROM unnest($1::uuid[], $2::text[],
+                                             $3::text[], $4::text[])
+                            AS t(request_id, approver, notes, suffix)
+                    ),
+                    upd AS (
+                        UPDATE db_requests r
+                        SET status = 'provisioned', approver = i.approver,
+                            approval_notes = i.notes,
+                            approved_at = NOW(), provisioned_at = NOW()
+                        FROM input i
+                        WHERE r.request_id = i.request_id AND r.status = 'pending'
+                        RETURNING r.request_id, r.team_name, r.db_type,
+                                  r.environment, r.size, i.suffix
+                    ),
+                    ins AS (
+                        INSERT INTO provisioned_databases
+                        (request_id, db_name, db_type, environment, host, port,
+                         estimated_cost, status)
+                        SELECT request_id,
+                               team_name || '_' || environment || '_' || db_type || '_' || suffix,
+                               db_type, environment, 'db-cluster.example.com',
+                               CASE db_type
+                                   WHEN 'postgres' THEN 5432
+                                   WHEN 'mysql' THEN 3306
+                                   WHEN 'redis' THEN 6379
+                               END,
+                               CASE size
+                                   WHEN 'small' THEN 50.00
+                                   WHEN 'medium' THEN 150.00
+                                   WHEN 'large' THEN 500.00
+                               END,
+                               'active'
+                        FROM upd
+                        RETURNING request_id
+                    )
+                    SELECT request_id::text FROM upd
+                """, [a.request_id for a in approvals],
+                    [a.approver for a in approvals],
+                    [a.notes for a in approvals],
+                    [uuid.uuid4().hex[:8] for _ in approvals])
+                approved = [row[0] for row in rows]
+
+            if rejections:
+                rows = await conn.fetch("""
+                    UPDATE db_requests r
+                    SET status = 'rejected', approver = i.approver,
+                        approval_notes = i.notes, approved_at = NOW()
+                    FROM unnest($1::uuid[], $2::text[], $3::text[])
+                        AS i(request_id, approver, notes)
+                    WHERE r.request_id = i.request_id AND r.status = 'pending'
+                    RETURNING r.request_id::text
+                """, [a.request_id for a in rejections],
+                    [a.approver for a in rejections],
+                    [a.notes for a in rejections])
+                rejected = [row[0] for row in rows]
+
+        processed = set(approved) | set(rejected)
+        skipped = [str(a.request_id) for a in batch.actions
+                   if str(a.request_id) not in processed]
+
+        logger.info("Batch processed: %d approved, %d rejected, %d skipped",
+                    len(approved), len(rejected), len(skipped))
+
+        return {
+            'approved': approved,
+            'rejected': rejected,
+            'skipped': skipped
         }
-        
-        # Port mapping
-        port_map = {
-            'postgres': 5432,
-            'mysql': 3306,
-            'redis': 6379
+
+    async def get_databases(self) -> dict:
+        async with self.pool.acquire() as conn:
+            # Repeatable read pins both statements to one snapshot so the
+            # totals always agree with the returned rows under concurrent
+            # approvals
+            async with conn.transaction(isolation='repeatable_read',
+                                        readonly=True):
+                rows = await conn.fetch(SELECT_DATABASES_SQL)
+                totals = await conn.fetchrow(DATABASE_TOTALS_SQL)
+
+        return {
+            'databases': [dict(row) for row in rows],
+            'total_count': totals[0],
+            'total_monthly_cost': round(totals[1], 2)
         }
-        
-        estimated_cost = cost_map.get(size, 100.00)
-        port = port_map.get(db_type, 5432)
-        
-        # Insert provisioned database
-        cursor.execute("""
-            INSERT INTO provisioned_databases
-            (request_id, db_name, db_type, environment, host, port, 
-             estimated_cost, status)
-            VALUES (%s, %s, %s, %s, %s, %s, %s, 'active')
-        """, (request_id, db_name, db_type, env, 'db-cluster.example.com', 
-              port, estimated_cost))
-        
-        # Update request status
-        cursor.execute("""
-            UPDATE db_requests
-            SET status = 'provisioned', provisioned_at = NOW()
-            WHERE request_id = %s
-        """, (request_id,))
-        
-        logger.info(f"Provisioned database: {db_name}")
-    
-    def get_databases(self) -> List[dict]:
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT d.db_id, d.db_name, d.db_type, d.environment, d.host, 
-                   d.port, d.estimated_cost, d.status, d.created_at,
-                   r.team_name
-            FROM provisioned_databases d
-            JOIN db_requests r ON d.request_id = r.request_id
-            WHERE d.status = 'active'
-            ORDER BY d.created_at DESC
-        """)
-        
-        databases = []
-        for row in cursor.fetchall():
-            databases.append({
-                'db_id': row[0],
-                'db_name': row[1],
-                'db_type': row[2],
-                'environment': row[3],
-                'host': row[4],
-                'port': row[5],
-                'estimated_monthly_cost': float(row[6]),
-                'status': row[7],
-                'created_at': row[8].isoformat() if row[8] else None,
-                'team_name': row[9]
-            })
-        
-        cursor.close()
-        return databases
-
-
-# Initialize service
+
+    async def stream_databases(self):
+        """Yield active databases as NDJSON, one row per line.
+
+        Rows are pulled through a server-side cursor in batches of 500 so
+        peak memory stays flat regardless of result size; a trailing
+        summary line carries the count and cost totals.
+        """
+        async with self.pool.acquire() as conn:
+            async with conn.transaction(isolation='repeatable_read',
+                                        readonly=True):
+                totals = await conn.fetchrow(DATABASE_TOTALS_SQL)
+                async for row in conn.cursor(SELECT_DATABASES_SQL, prefetch=500):
+                    yield orjson.dumps(dict(row)) + b"\n"
+                yield orjson.dumps({
+                    'total_count': totals[0],
+                    'total_monthly_cost': round(totals[1], 2)
+                }) + b"\n"
+
+
+# Initialize service (pool is created on startup)
 service = ProvisioningService()
 
+# Short-lived cache of pre-serialized list responses; polling dashboards
+# hit this instead of Postgres. Cleared whenever a POST mutates state.
+list_cache = TTLCache(maxsize=8, ttl=2)
+
+
+@app.on_event("startup")
+async def startup():
+    await service.connect()
+    await service.setup_tables()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    await service.close()
+    _log_listener.stop()
+
 
 # API Endpoints
 @app.get("/")
-def root():
+async def root():
     return {
         "service": "Self-Service Database Provisioning",
         "version": "1.0.0",
@@ -281,40 +465,64 @@ def root():
             "POST /requests": "Submit new database request",
             "GET /requests": "List all requests",
             "POST /approve": "Approve/reject request",
-            "GET /databases": "List provisioned databases"
+            "POST /approve/batch": "Approve/reject a batch of requests",
+            "GET /databases": "List provisioned databases",
+            "GET /databases/stream": "Stream provisioned databases as NDJSON"
         }
     }
 
 
 @app.post("/requests")
-def create_request(request: DatabaseRequest):
+async def create_request(request: DatabaseRequest):
     """Submit a new database provisioning request"""
-    return service.create_request(request)
+    result = await service.create_request(request)
+    list_cache.clear()
+    return result
 
 
 @app.get("/requests")
-def list_requests(status: Optional[str] = None):
+async def list_requests(status: Optional[str] = None):
     """List database requests, optionally filtered by status"""
-    return {"requests": service.get_requests(status)}
+    key = ('requests', status)
+    body = list_cache.get(key)
+    if body is None:
+        body = orjson.dumps({"requests": await service.get_requests(status)})
+        list_cache[key] = body
+    return Response(content=body, media_type="application/json")
 
 
 @app.post("/approve")
-def approve_request(approval: ApprovalAction):
+async def approve_request(approval: ApprovalAction):
     """Approve or reject a database request"""
-    return service.process_approval(approval)
+    result = await service.process_approval(approval)
+    list_cache.clear()
+    return result
+
+
+@app.post("/approve/batch")
+async def approve_batch(batch: ApprovalBatch):
+    """Approve or reject a batch of requests in one round-trip"""
+    result = await service.process_approval_batch(batch)
+    list_cache.clear()
+    return result
 
 
 @app.get("/databases")
-def list_databases():
+async def list_databases():
     """List all provisioned databases"""
-    databases = service.get_databases()
-    total_cost = sum(db['estimated_monthly_cost'] for db in databases)
-    
-    return {
-        "databases": databases,
-        "total_count": len(databases),
-        "total_monthly_cost": round(total_cost, 2)
-    }
+    key = ('databases', None)
+    body = list_cache.get(key)
+    if body is None:
+        body = orjson.dumps(await service.get_databases())
+        list_cache[key] = body
+    return Response(content=body, media_type="application/json")
+
+
+@app.get("/databases/stream")
+async def stream_databases():
+    """Stream provisioned databases as NDJSON (for large result sets)"""
+    return StreamingResponse(service.stream_databases(),
+                             media_type="application/x-ndjson")
 
 
 if __name__ == "__main__":
@@ -322,4 +530,14 @@ if __name__ == "__main__":
     print("\nStarting Self-Service DB Provisioning API...")
     print("API Docs: http://localhost:8000/docs")
     print("=" * 60)
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # App is passed as an import string so each worker process imports the
+    # module and builds its own pool in the startup hook.
+    uvicorn.run(
+        "provisioning_api:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=os.cpu_count(),
+        loop="uvloop",
+        http="httptools",
+        log_level="warning"
+    )
@@ -0,0 +1,181 @@
+"""Integration tests for the provisioning API.
+
+These run against the same Postgres the app uses (DB_HOST/DB_PORT,
+default localhost:6432) and are skipped when it is not reachable.
+"""
+
+import asyncio
+import os
+import sys
+import uuid
+
+import pytest
+
+sys.path.append('src')
+
+asyncpg = pytest.importorskip("asyncpg")
+httpx = pytest.importorskip("httpx")
+
+from provisioning_api import app, service
+
+
+REQUEST_BODY = {
+    "team_name": "qa-team",
+    "db_type": "postgres",
+    "environment": "dev",
+    "size": "small",
+    "purpose": "Integration test"
+}
+
+
+def _db_available() -> bool:
+    async def probe():
+        conn = await asyncpg.connect(
+            host=os.environ.get('DB_HOST', 'localhost'),
+            port=int(os.environ.get('DB_PORT', 6432)),
+            database='provisioning_db',
+            user='postgres',
+            password='postgres',
+            timeout=2
+        )
+        await conn.close()
+
+    try:
+        asyncio.run(probe())
+        return True
+    except Exception:
+        return False
+
+
+requires_db = pytest.mark.skipif(
+    not _db_available(), reason="provisioning database not reachable"
+)
+
+
+async def _cleanup(request_ids):
+    ids = [uuid.UUID(r) for r in request_ids]
+    await service.pool.execute(
+        "DELETE FROM provisioned_databases WHERE request_id = ANY($1::uuid[])",
+        ids)
+    await service.pool.execute(
+        "DELETE FROM db_requests WHERE request_id = ANY($1::uuid[])", ids)
+
+
+@requires_db
+def test_approve_provisions_database():
+    async def scenario():
+        await service.connect()
+        await service.setup_tables()
+        transport = httpx.ASGITransport(app=app)
+        request_ids = []
+        try:
+            async with httpx.AsyncClient(transport=transport,
+                                         base_url="http://test") as client:
+                response = await client.post("/requests", json=REQUEST_BODY)
+                assert response.status_code == 200
+                request_id = response.json()['request_id']
+                request_ids.append(request_id)
+
+                response = await client.post("/approve", json={
+                    "request_id": request_id,
+                    "action": "approve",
+                    "approver": "qa@company.com",
+                    "notes": "Integration test"
+                })
+                assert response.status_code == 200
+                assert response.json()['status'] == 'approved'
+
+                status = await service.pool.fetchval(
+                    "SELECT status FROM db_requests WHERE request_id = $1",
+                    uuid.UUID(request_id))
+                assert status == 'provisioned'
+
+                db_name = await service.pool.fetchval(
+                    "SELECT db_name FROM provisioned_databases"
+                    " WHERE request_id = $1",
+                    uuid.UUID(request_id))
+                assert db_name is not None
+                assert db_name.startswith("qa-team_dev_postgres_")
+
+                # Approving the same request again is a conflict
+                response = await client.post("/approve", json={
+                    "request_id": request_id,
+                    "action": "approve",
+                    "approver": "qa@company.com",
+                    "notes": None
+                })
+                assert response.status_code == 400
+        finally:
+            await _cleanup(request_ids)
+            await service.close()
+
+    asyncio.run(scenario())
+
+
+@requires_db
+def test_approve_batch_reports_processed_ids():
+    async def scenario():
+        await service.connect()
+        await service.setup_tables()
+        transport = httpx.ASGITransport(app=app)
+        request_ids = []
+        try:
+            async with httpx.AsyncClient(transport=transport,
+                                         base_url="http://test") as client:
+                for _ in range(3):
+                    response = await client.post("/requests",
+                                                 json=REQUEST_BODY)
+                    assert response.status_code == 200
+                    request_ids.append(response.json()['request_id'])
+
+                unknown_id = str(uuid.uuid4())
+                actions = [
+                    {"request_id": request_ids[0], "action": "approve",
+                     "approver": "qa@company.com", "notes": None},
+                    {"request_id": request_ids[1], "action": "approve",
+                     "approver": "qa@company.com", "notes": None},
+                    {"request_id": request_ids[2], "action": "reject",
+                     "approver": "qa@company.com", "notes": None},
+                    {"request_id": unknown_id, "action": "approve",
+                     "approver": "qa@company.com", "notes": None},
+                ]
+                response = await client.post("/approve/batch",
+                                             json={"actions": actions})
+                assert response.status_code == 200
+                result = response.json()
+                assert sorted(result['approved']) == sorted(request_ids[:2])
+                assert result['rejected'] == [request_ids[2]]
+                assert result['skipped'] == [unknown_id]
+
+                for request_id in request_ids[:2]:
+                    status = await service.pool.fetchval(
+                        "SELECT status FROM db_requests WHERE request_id = $1",
+                        uuid.UUID(request_id))
+                    assert status == 'provisioned'
+        finally:
+            await _cleanup(request_ids)
+            await service.close()
+
+    asyncio.run(scenario())
+
+
+@requires_db
+def test_approve_unknown_request_returns_404():
+    async def scenario():
+        await service.connect()
+        await service.setup_tables()
+        transport = httpx.ASGITransport(app=app)
+        try:
+            async with httpx.AsyncClient(transport=transport,
+                                         base_url="http://test") as client:
+                response = await client.post("/approve", json={
+                    "request_id": str(uuid.uuid4()),
+                    "action": "approve",
+                    "approver": "qa@company.com",
+                    "notes": None
+                })
+                assert response.status_code == 404
+        finally:
+            await service.close()
+
+    asyncio.run(scenario())